@@ -16,6 +16,15 @@ from hikcamerabot.exceptions import APIBadResponseCodeError, APIRequestError
 _RETRY_WAIT: Final[float] = 0.5
 _RETRY_STOP_AFTER_ATTEMPT: Final[int] = 3
 
+# One pooled client per camera is shared by all endpoints. Keep a few idle
+# connections alive long enough to be reused by bursts of API calls, e.g.
+# enabling all alarm triggers at once, instead of reconnecting each time.
+# The cap leaves room for the long-lived alert stream, a concurrent trigger
+# burst and on-demand snapshots.
+_CONN_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_connections=10, max_keepalive_connections=4, keepalive_expiry=60
+)
+
 
 class HikvisionAPIClient:
     """Hikvision API Class."""
@@ -38,7 +47,9 @@ class HikvisionAPIClient:
                 username=self._conf.auth.user,
                 password=self._conf.auth.password,
             ),
-            transport=httpx.AsyncHTTPTransport(verify=False, retries=3),
+            transport=httpx.AsyncHTTPTransport(
+                verify=False, retries=3, limits=_CONN_LIMITS
+            ),
         )
 
     @retry(
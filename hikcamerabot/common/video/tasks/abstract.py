@@ -7,13 +7,14 @@ from pathlib import Path
 from hikcamerabot.utils.process import kill_proc
 
 
-class AbstractFfBinaryTask(ABC):
+class AbstractFfBinaryCmdTask(ABC):
+    """Base task running an ffmpeg/ffprobe command."""
+
     _CMD: str | None = None
     _CMD_TIMEOUT: int = 60
 
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self) -> None:
         self._log = logging.getLogger(self.__class__.__name__)
-        self._file_path = file_path
 
     async def _run_proc(self, cmd: str) -> asyncio.subprocess.Process | None:
         self._log.debug('Running command: "%s"', cmd)
@@ -34,3 +35,11 @@ class AbstractFfBinaryTask(ABC):
     @abstractmethod
     async def run(self) -> None:
         """Main entry point."""
+
+
+class AbstractFfBinaryTask(AbstractFfBinaryCmdTask):
+    """Base task running an ffmpeg/ffprobe command on a single file."""
+
+    def __init__(self, file_path: Path) -> None:
+        super().__init__()
+        self._file_path = file_path
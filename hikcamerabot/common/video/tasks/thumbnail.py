@@ -1,6 +1,9 @@
 from pathlib import Path
 
-from hikcamerabot.common.video.tasks.abstract import AbstractFfBinaryTask
+from hikcamerabot.common.video.tasks.abstract import (
+    AbstractFfBinaryCmdTask,
+    AbstractFfBinaryTask,
+)
 from hikcamerabot.constants import FFMPEG_BIN
 from hikcamerabot.utils.process import get_stdout_stderr
 
@@ -50,3 +53,66 @@ class MakeThumbnailTask(AbstractFfBinaryTask):
             self._log.exception(
                 'Cleanup failed for errored thumbnail "%s"', self._thumbnail_path
             )
+
+
+class MakeThumbnailsTask(AbstractFfBinaryCmdTask):
+    """Make thumbnails for several video files with a single ffmpeg process."""
+
+    _CMD = f'{FFMPEG_BIN} -y -loglevel error {{inputs}} {{outputs}}'
+    _CMD_INPUT = '-i {filepath}'
+    _CMD_OUTPUT = '-map {idx}:v:0 -frames:v 1 -q:v 31 {thumbpath}'
+
+    def __init__(self, thumbnail_paths: list[Path], file_paths: list[Path]) -> None:
+        if not file_paths:
+            raise ValueError('No files to make thumbnails for')
+        if len(thumbnail_paths) != len(file_paths):
+            raise ValueError('Each file path must have a thumbnail path')
+        super().__init__()
+        self._thumbnail_paths = thumbnail_paths
+        self._file_paths = file_paths
+
+    async def run(self) -> bool:
+        return await self._make_thumbnails()
+
+    async def _make_thumbnails(self) -> bool:
+        cmd = self._CMD.format(
+            inputs=' '.join(
+                self._CMD_INPUT.format(filepath=path) for path in self._file_paths
+            ),
+            outputs=' '.join(
+                self._CMD_OUTPUT.format(idx=idx, thumbpath=path)
+                for idx, path in enumerate(self._thumbnail_paths)
+            ),
+        )
+        proc = await self._run_proc(cmd)
+        if not proc:
+            self._err_cleanup()
+            return False
+
+        stdout, stderr = await get_stdout_stderr(proc)
+        self._log.debug(
+            'Process "%s" returncode: %d, stdout: %s, stderr: %s',
+            cmd,
+            proc.returncode,
+            stdout,
+            stderr,
+        )
+        if proc.returncode:
+            self._log.error('Failed to make thumbnails for %s', self._file_paths)
+            self._err_cleanup()
+            return False
+        return True
+
+    def _err_cleanup(self) -> None:
+        """Cleanup thumbnails partially written by the failed process."""
+        for thumbnail_path in self._thumbnail_paths:
+            if not thumbnail_path.exists():
+                continue
+
+            self._log.info('Cleaning up errored thumbnail: "%s"', thumbnail_path)
+            try:
+                thumbnail_path.unlink()
+            except Exception:
+                self._log.exception(
+                    'Cleanup failed for errored thumbnail "%s"', thumbnail_path
+                )
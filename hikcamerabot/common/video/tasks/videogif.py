@@ -117,7 +117,7 @@ class RecordVideoGifTask:
         self._post_err_cleanup()
         err_msg = f'Failed to record {self._file_path} on {self._cam.description}'
         self._log.error(err_msg)
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             SendTextOutboundEvent(
                 event=EventType.SEND_TEXT,
                 text=f'{err_msg}.\nEvent type: {self._event.value}\nCheck logs.',
@@ -189,7 +189,7 @@ class RecordVideoGifTask:
         return not is_empty
 
     async def _send_result(self) -> None:
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             VideoOutboundEvent(
                 event=self._event,
                 video_path=self._file_path,
@@ -207,7 +207,7 @@ class RecordVideoGifTask:
     async def _send_confirmation_message(self) -> None:
         if self._video_type is VideoGifType.ON_DEMAND:
             text = f'📹 Recording video for {self._rec_time} seconds'
-            await self._result_queue.put(
+            await self._result_queue.put_event(
                 SendTextOutboundEvent(
                     event=EventType.SEND_TEXT,
                     message=self._message,
@@ -28,6 +28,7 @@ class LivestreamConfSchema(StrictBaseModel):
 class BaseDVRStorageUploadConfSchema(StrictBaseModel, ABC):
     enabled: bool
     group_id: int | None
+    parallel_uploads: IntMin1 = 1
 
     @model_validator(mode='after')
     def validate_group_id(self) -> Self:
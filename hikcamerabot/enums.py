@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from enum import StrEnum, unique
+from enum import IntEnum, StrEnum, unique
 
 
 class BaseNonUniqueChoiceStrEnum(StrEnum):
@@ -48,6 +48,15 @@ class EventType(BaseUniqueChoiceStrEnum):
     SEND_TIMELAPSE = 'send_timelapse'
 
 
+@unique
+class EventPriority(IntEnum):
+    """Outbound event priority, lower value is dispatched first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
 class CmdSectionType(BaseUniqueChoiceStrEnum):
     GENERAL = 'General'
     INFRARED = 'Infrared Mode'
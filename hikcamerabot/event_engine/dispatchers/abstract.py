@@ -1,9 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from hikcamerabot.camerabot import CameraBot
+    from hikcamerabot.enums import EventType
 
 
 class AbstractDispatcher(ABC):
@@ -12,7 +15,10 @@ class AbstractDispatcher(ABC):
     def __init__(self, bot: 'CameraBot') -> None:
         self._log = logging.getLogger(self.__class__.__name__)
         self._bot = bot
-        self._dispatch = {k: v(self._bot) for k, v in self.DISPATCH.items()}
+        # Resolve bound `handle` methods once instead of on every dispatch.
+        self._dispatch: dict[EventType, Callable[[Any], Awaitable[None]]] = {
+            k: v(self._bot).handle for k, v in self.DISPATCH.items()
+        }
 
     @abstractmethod
     async def dispatch(self, data: dict) -> None:
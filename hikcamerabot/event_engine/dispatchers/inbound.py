@@ -31,4 +31,4 @@ class InboundEventDispatcher(AbstractDispatcher):
     async def dispatch(self, event: BaseInboundEvent) -> None:
         """Dispatch inbound event to appropriate handler."""
         self._log.debug('Inbound event for %s: %s', event.cam.id, event)
-        await self._dispatch[event.event].handle(event)
+        await self._dispatch[event.event](event)
@@ -35,4 +35,4 @@ class OutboundEventDispatcher(AbstractDispatcher):
     async def dispatch(self, event: BaseOutboundEvent) -> None:
         """Dispatch outbound event to appropriate handler."""
         self._log.debug('Outbound event: "%s"', event)
-        await self._dispatch[event.event].handle(event)
+        await self._dispatch[event.event](event)
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from pyrogram.types import Message
 
-from hikcamerabot.enums import EventType
+from hikcamerabot.enums import EventPriority, EventType
 
 if TYPE_CHECKING:
     from hikcamerabot.camera import HikvisionCam
@@ -16,8 +16,10 @@ class BaseInboundEvent:
     message: Message
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseOutboundEvent:
+    PRIORITY: ClassVar[EventPriority] = EventPriority.NORMAL
+
     cam: 'HikvisionCam'
     event: EventType
     message: Message | None
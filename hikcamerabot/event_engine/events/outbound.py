@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
+from typing import ClassVar
 
 from pyrogram.enums import ParseMode
 from pyrogram.types import Message
@@ -8,6 +9,7 @@ from pyrogram.types import Message
 from hikcamerabot.enums import (
     AlarmType,
     DetectionType,
+    EventPriority,
     EventType,
     ServiceType,
     StreamType,
@@ -16,52 +18,64 @@ from hikcamerabot.event_engine.events.abstract import BaseOutboundEvent
 from hikcamerabot.utils.file import format_bytes
 
 
-@dataclass
 class FileSizeMixin:
+    # Not a dataclass: two slotted dataclass bases would conflict in layout, so
+    # events declare the `file_size` field themselves.
+    __slots__ = ()
+
     file_size: int
 
     def file_size_human(self) -> str:
         return format_bytes(num=self.file_size)
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoOutboundEvent(BaseOutboundEvent, FileSizeMixin):
+    PRIORITY: ClassVar[EventPriority] = EventPriority.LOW
+
     thumb_path: Path | None
     video_path: Path
     video_duration: int
     video_height: int
     video_width: int
     create_ts: int
+    file_size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertSnapshotOutboundEvent(BaseOutboundEvent, FileSizeMixin):
     img: BytesIO
     ts: int
     resized: bool
     detection_type: DetectionType
     alert_count: int
+    file_size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotOutboundEvent(BaseOutboundEvent, FileSizeMixin):
     img: BytesIO
     create_ts: int
     taken_count: int
     resized: bool
     message: Message
+    file_size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SendTextOutboundEvent:
+    PRIORITY: ClassVar[EventPriority] = EventPriority.HIGH
+
     event: EventType
     text: str
     parse_mode: ParseMode = ParseMode.HTML
     message: Message | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AlarmConfOutboundEvent(BaseOutboundEvent):
+    PRIORITY: ClassVar[EventPriority] = EventPriority.HIGH
+
     service_type: ServiceType
     service_name: AlarmType
     state: bool
@@ -69,8 +83,10 @@ class AlarmConfOutboundEvent(BaseOutboundEvent):
     text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamOutboundEvent(BaseOutboundEvent):
+    PRIORITY: ClassVar[EventPriority] = EventPriority.HIGH
+
     service_type: ServiceType
     stream_type: StreamType
     state: bool
@@ -78,8 +94,10 @@ class StreamOutboundEvent(BaseOutboundEvent):
     text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionConfOutboundEvent(BaseOutboundEvent):
+    PRIORITY: ClassVar[EventPriority] = EventPriority.HIGH
+
     type: DetectionType
     state: bool
     message: Message
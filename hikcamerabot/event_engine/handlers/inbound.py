@@ -1,10 +1,8 @@
 """Task event s module."""
 
-import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
-from hikcamerabot.constants import DETECTION_SWITCH_MAP
 from hikcamerabot.enums import EventType
 from hikcamerabot.event_engine.events.abstract import BaseInboundEvent
 from hikcamerabot.event_engine.events.inbound import (
@@ -24,6 +22,8 @@ from hikcamerabot.event_engine.events.outbound import (
 )
 from hikcamerabot.event_engine.queue import get_result_queue
 from hikcamerabot.exceptions import ServiceRuntimeError
+from hikcamerabot.utils.file import bytes_io_size
+from hikcamerabot.utils.log import ClassLogger
 from hikcamerabot.utils.shared import bold
 
 if TYPE_CHECKING:
@@ -31,8 +31,9 @@ if TYPE_CHECKING:
 
 
 class AbstractTaskEvent(ABC):
+    _log = ClassLogger()
+
     def __init__(self, bot: 'CameraBot') -> None:
-        self._log = logging.getLogger(self.__class__.__name__)
         self._bot = bot
         self._result_queue = get_result_queue()
 
@@ -53,7 +54,7 @@ class TaskTakeSnapshot(AbstractTaskEvent):
                 channel=channel, resize=event.resize
             )
         except Exception as err:
-            await self._result_queue.put(
+            await self._result_queue.put_event(
                 SendTextOutboundEvent(
                     event=EventType.SEND_TEXT,
                     text=(
@@ -65,7 +66,7 @@ class TaskTakeSnapshot(AbstractTaskEvent):
             )
             return
 
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             SnapshotOutboundEvent(
                 event=event.event,
                 img=img,
@@ -74,7 +75,7 @@ class TaskTakeSnapshot(AbstractTaskEvent):
                 resized=event.resize,
                 message=event.message,
                 cam=cam,
-                file_size=img.getbuffer().nbytes,
+                file_size=bytes_io_size(img),
             )
         )
 
@@ -90,7 +91,7 @@ class TaskDetectionConf(AbstractTaskEvent):
     async def _handle(self, event: DetectionConfEvent) -> None:
         cam = event.cam
         trigger = event.type
-        name = DETECTION_SWITCH_MAP[trigger]['name'].value
+        name = cam.services.alarm.get_trigger_name(trigger)
         state = event.state
 
         self._log.info(
@@ -99,7 +100,7 @@ class TaskDetectionConf(AbstractTaskEvent):
             name,
         )
         text = await cam.services.alarm.trigger_switch(trigger=trigger, state=state)
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             DetectionConfOutboundEvent(
                 event=event.event,
                 type=event.type,
@@ -126,7 +127,7 @@ class TaskAlarmConf(AbstractTaskEvent):
         except ServiceRuntimeError as err:
             text = str(err)
 
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             AlarmConfOutboundEvent(
                 event=event.event,
                 service_type=service_type,
@@ -155,7 +156,7 @@ class TaskStreamConf(AbstractTaskEvent):
         except ServiceRuntimeError as err:
             text = str(err)
 
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             StreamOutboundEvent(
                 event=event.event,
                 service_type=service_type,
@@ -171,7 +172,7 @@ class TaskStreamConf(AbstractTaskEvent):
 class TaskIrcutFilterConf(AbstractTaskEvent):
     async def _handle(self, event: IrcutConfEvent) -> None:
         await event.cam.set_ircut_filter(filter_type=event.filter_type)
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             SendTextOutboundEvent(
                 event=EventType.SEND_TEXT,
                 message=event.message,
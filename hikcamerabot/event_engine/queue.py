@@ -1,10 +1,30 @@
-from asyncio import Queue
+import itertools
+from asyncio import PriorityQueue
 
 from hikcamerabot.event_engine.events.abstract import BaseOutboundEvent
 from hikcamerabot.event_engine.events.outbound import SendTextOutboundEvent
 
-_RESULT_QUEUE = Queue()
+type OutboundEvent = BaseOutboundEvent | SendTextOutboundEvent
 
 
-def get_result_queue() -> Queue[BaseOutboundEvent | SendTextOutboundEvent]:
+class ResultQueue(PriorityQueue[tuple[int, int, OutboundEvent]]):
+    """Outbound event queue where events with lower `PRIORITY` go first."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Tie-breaker which keeps FIFO order within the same priority.
+        self._seq = itertools.count()
+
+    async def put_event(self, event: OutboundEvent) -> None:
+        await self.put((event.PRIORITY, next(self._seq), event))
+
+    async def get_event(self) -> OutboundEvent:
+        *_, event = await self.get()
+        return event
+
+
+_RESULT_QUEUE = ResultQueue()
+
+
+def get_result_queue() -> ResultQueue:
     return _RESULT_QUEUE
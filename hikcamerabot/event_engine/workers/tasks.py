@@ -20,7 +20,7 @@ class ResultWorkerTask:
     async def run(self) -> None:
         while True:
             while not self._res_queue.empty():
-                event = await self._res_queue.get()
+                event = await self._res_queue.get_event()
                 try:
                     await self._outbound_dispatcher.dispatch(event)
                 except Exception:
@@ -1,7 +1,7 @@
-import logging
 from typing import TYPE_CHECKING
 
 from hikcamerabot.bot_setup import BotSetup
+from hikcamerabot.utils.log import ClassLogger
 from hikcamerabot.version import __version__
 
 if TYPE_CHECKING:
@@ -11,8 +11,9 @@ if TYPE_CHECKING:
 class BotLauncher:
     """Bot launcher which parses configuration file, creates bot with camera instances and finally starts the bot."""
 
+    _log = ClassLogger()
+
     def __init__(self) -> None:
-        self._log = logging.getLogger(self.__class__.__name__)
         self._bot: CameraBot | None = None
 
     async def launch(self) -> None:
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Union
 
 from hikcamerabot.enums import AlarmType, DetectionType, ServiceType
 from hikcamerabot.event_engine.queue import get_result_queue
+from hikcamerabot.utils.log import ClassLogger
 
 if TYPE_CHECKING:
     from hikcamerabot.camera import HikvisionCam
@@ -17,8 +18,9 @@ class AbstractService(ABC):
     NAME: DetectionType | AlarmType | None = None
     TYPE: ServiceType | None = None
 
+    _log = ClassLogger()
+
     def __init__(self, cam: 'HikvisionCam') -> None:
-        self._log = logging.getLogger(self.__class__.__name__)
         self._cls_name = self.__class__.__name__
         self.cam = cam
 
@@ -44,6 +44,17 @@ class AlarmService(AbstractService):
 
         self._started: asyncio.Event = asyncio.Event()
 
+        # Conf is immutable, resolve per-trigger lookups once.
+        self._enabled_triggers: frozenset[DetectionType] = frozenset(
+            DetectionType(trigger)
+            for trigger in self.ALARM_TRIGGERS
+            if self._conf.get_detection_schema_by_type(type_=trigger).enabled
+        )
+        self._trigger_names: dict[DetectionType, str] = {
+            DetectionType(trigger): DETECTION_SWITCH_MAP[trigger]['name'].value
+            for trigger in self.ALARM_TRIGGERS
+        }
+
     @property
     def alert_count(self) -> int:
         return self._alert_count
@@ -59,10 +70,11 @@ class AlarmService(AbstractService):
     @property
     def enabled_in_conf(self) -> bool:
         """Check if any alarm trigger is enabled in conf."""
-        return any(
-            self._conf.get_detection_schema_by_type(type_=trigger).enabled
-            for trigger in self.ALARM_TRIGGERS
-        )
+        return bool(self._enabled_triggers)
+
+    def get_trigger_name(self, trigger: DetectionType) -> str:
+        """Return verbose trigger name."""
+        return self._trigger_names[trigger]
 
     async def start(self) -> None:
         """Enable alarm service and enable triggers on physical camera."""
@@ -89,9 +101,24 @@ class AlarmService(AbstractService):
         )
 
     async def _enable_triggers_on_camera(self) -> None:
-        for trigger in self.ALARM_TRIGGERS:
-            if self._conf.get_detection_schema_by_type(type_=trigger).enabled:
-                await self.trigger_switch(trigger=DetectionType(trigger), state=True)
+        """Enable all configured triggers concurrently.
+
+        Raise `ServiceRuntimeError` only if none of them could be enabled.
+        """
+        coros = [
+            self.trigger_switch(trigger=trigger, state=True)
+            for trigger in self._enabled_triggers
+        ]
+        if not coros:
+            return
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        errors = [res for res in results if isinstance(res, BaseException)]
+        for err in errors:
+            if not isinstance(err, ServiceRuntimeError):
+                raise err
+        if len(errors) == len(results):
+            raise ServiceRuntimeError('; '.join(str(err) for err in errors))
 
     async def stop(self) -> None:
         """Disable alarm."""
@@ -106,7 +133,7 @@ class AlarmService(AbstractService):
 
     async def trigger_switch(self, trigger: DetectionType, state: bool) -> str | None:
         """Trigger switch."""
-        full_name = DETECTION_SWITCH_MAP[trigger]['name']
+        full_name = self._trigger_names[trigger]
         self._log.debug('%s %s', 'Enabling' if state else 'Disabling', full_name)
         try:
             return await self._api.switch(trigger=trigger, state=state)
@@ -12,6 +12,7 @@ from hikcamerabot.event_engine.events.outbound import (
     SendTextOutboundEvent,
 )
 from hikcamerabot.event_engine.queue import get_result_queue
+from hikcamerabot.utils.file import bytes_io_size
 
 if TYPE_CHECKING:
     from hikcamerabot.camera import HikvisionCam
@@ -45,7 +46,7 @@ class AlarmTextMessageNotificationTask(AbstractAlertNotificationTask):
 
     async def _send_alert_text(self) -> None:
         detection_name = DETECTION_SWITCH_MAP[self._detection_type]['name']
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             SendTextOutboundEvent(
                 event=EventType.SEND_TEXT,
                 text=emojize(
@@ -87,7 +88,7 @@ class AlarmPicNotificationTask(AbstractAlertNotificationTask):
             type_=self._detection_type.value
         ).fullpic
         photo, ts = await self._cam.take_snapshot(channel=channel, resize=resize)
-        await self._result_queue.put(
+        await self._result_queue.put_event(
             AlertSnapshotOutboundEvent(
                 cam=self._cam,
                 event=EventType.ALERT_SNAPSHOT,
@@ -97,6 +98,6 @@ class AlarmPicNotificationTask(AbstractAlertNotificationTask):
                 detection_type=self._detection_type,
                 alert_count=self._alert_count,
                 message=None,
-                file_size=photo.getbuffer().nbytes,
+                file_size=bytes_io_size(photo),
             )
         )
@@ -1,23 +1,67 @@
 import asyncio
-import logging
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Final
 
 from hikcamerabot.common.video.tasks.ffprobe_context import GetFfprobeContextTask
-from hikcamerabot.common.video.tasks.thumbnail import MakeThumbnailTask
+from hikcamerabot.common.video.tasks.thumbnail import (
+    MakeThumbnailsTask,
+    MakeThumbnailTask,
+)
+from hikcamerabot.utils.log import ClassLogger
+from hikcamerabot.utils.task import wrap
 
 if TYPE_CHECKING:
     from hikcamerabot.camera import HikvisionCam
 
+# Shared by all DVR files so a burst of rotated segments from many cameras
+# doesn't spawn an unbounded number of ffprobe/ffmpeg processes at once.
+_FF_BINARY_SEMAPHORE: Final[asyncio.Semaphore] = asyncio.Semaphore(os.cpu_count() or 1)
+
+# Max number of inputs passed to one ffmpeg thumbnail process.
+_THUMBNAIL_BATCH_SIZE: Final[int] = 10
+
+
+def _parse_probe_ctx(probe_ctx: dict) -> tuple[int, int, int]:
+    """Return duration, height and width of the first video stream."""
+    video_streams = [
+        stream for stream in probe_ctx['streams'] if stream['codec_type'] == 'video'
+    ]
+    return (
+        int(float(probe_ctx['format']['duration'])),
+        video_streams[0]['height'],
+        video_streams[0]['width'],
+    )
+
 
 class DvrFile:
     """Recorded DVR File Wrapper Class."""
 
+    __slots__ = (
+        '_cam',
+        '_duration',
+        '_filename',
+        '_full_path',
+        '_has_thumbnail',
+        '_height',
+        '_is_broken',
+        '_is_stat_cached',
+        '_is_upload_failed',
+        '_lock_count',
+        '_probe_ctx',
+        '_stat',
+        '_storage_path',
+        '_thumbnail',
+        '_width',
+    )
+
+    _log = ClassLogger()
+
     def __init__(self, filename: str, lock_count: int, cam: 'HikvisionCam') -> None:
         if lock_count <= 0:
             raise RuntimeError('Lock count cannot be lower or equal 0')
 
-        self._log = logging.getLogger(self.__class__.__name__)
         self._filename = filename
         self._lock_count = lock_count
         self._cam = cam
@@ -32,6 +76,11 @@ class DvrFile:
         self._probe_ctx: dict | None = None
 
         self._is_broken: bool = False
+        self._is_upload_failed: bool = False
+
+        self._stat: os.stat_result | None = None
+        self._is_stat_cached: bool = False
+        self._has_thumbnail: bool | None = None
 
     def __str__(self) -> str:
         return self._filename
@@ -42,52 +91,85 @@ class DvrFile:
     def __hash__(self) -> int:
         return hash(self._filename)
 
-    def _mark_as_broken(self) -> None:
+    def mark_as_broken(self) -> None:
         self._log.warning('Marking file "%s" as broken', self._full_path)
         self._is_broken = True
 
-    async def _get_probe_ctx(self) -> None:
-        self._probe_ctx = await GetFfprobeContextTask(self.full_path).run()
+    def mark_as_upload_failed(self) -> None:
+        self._log.warning('Marking file "%s" as failed to upload', self._full_path)
+        self._is_upload_failed = True
+
+    async def make_probe_context(self) -> None:
+        async with _FF_BINARY_SEMAPHORE:
+            self._probe_ctx = await GetFfprobeContextTask(self.full_path).run()
         if not self._probe_ctx:
-            self._mark_as_broken()
+            self.mark_as_broken()
             return
-        video_streams = [
-            stream
-            for stream in self._probe_ctx['streams']
-            if stream['codec_type'] == 'video'
-        ]
         try:
-            self._duration = int(float(self._probe_ctx['format']['duration']))
-            self._height = video_streams[0]['height']
-            self._width = video_streams[0]['width']
-        except KeyError:
+            self._duration, self._height, self._width = _parse_probe_ctx(
+                self._probe_ctx
+            )
+        except (KeyError, IndexError):
             self._log.exception(
                 'Failed to gather video stream metadata: %s', self._probe_ctx
             )
-            self._mark_as_broken()
+            self.mark_as_broken()
 
-    async def _make_thumbnail_frame(self) -> None:
-        if not await MakeThumbnailTask(self._thumbnail, self.full_path).run():
+    async def make_thumbnail(self) -> None:
+        async with _FF_BINARY_SEMAPHORE:
+            is_created = await MakeThumbnailTask(self._thumbnail, self.full_path).run()
+        if not is_created:
             self._log.error('Error during making thumbnail for %s', self.full_path)
 
     async def make_context(self) -> None:
-        await asyncio.gather(self._get_probe_ctx(), self._make_thumbnail_frame())
+        await asyncio.gather(self.make_probe_context(), self.make_thumbnail())
+        self.invalidate()
+
+    def refresh_stat(self) -> os.stat_result | None:
+        """Stat the file and its thumbnail, cache the results until invalidated."""
+        try:
+            self._stat = self._full_path.stat()
+        except FileNotFoundError:
+            self._stat = None
+        self._is_stat_cached = True
+        self._has_thumbnail = self._thumbnail.is_file()
+        return self._stat
+
+    refresh_stat_async = wrap(refresh_stat)
+
+    def invalidate(self) -> None:
+        """Drop cached file and thumbnail stat results."""
+        self._stat = None
+        self._is_stat_cached = False
+        self._has_thumbnail = None
+
+    def _get_stat(self) -> os.stat_result | None:
+        if not self._is_stat_cached:
+            return self.refresh_stat()
+        return self._stat
 
     def decrement_lock_count(self) -> None:
         if self._lock_count > 0:
             self._lock_count -= 1
+        self.invalidate()
 
     @property
     def is_broken(self) -> bool:
         return self._is_broken
 
+    @property
+    def is_upload_failed(self) -> bool:
+        return self._is_upload_failed
+
     @property
     def is_empty(self) -> bool:
-        return self.full_path.stat().st_size == 0
+        stat = self._get_stat()
+        return stat is None or stat.st_size == 0
 
     @property
     def exists(self) -> bool:
-        return self.full_path.is_file()
+        stat = self._get_stat()
+        return stat is not None and S_ISREG(stat.st_mode)
 
     @property
     def name(self) -> str:
@@ -95,7 +177,13 @@ class DvrFile:
 
     @property
     def thumbnail(self) -> Path | None:
-        return self._thumbnail if self._thumbnail.is_file() else None
+        if self._has_thumbnail is None:
+            self._has_thumbnail = self._thumbnail.is_file()
+        return self._thumbnail if self._has_thumbnail else None
+
+    @property
+    def thumbnail_path(self) -> Path:
+        return self._thumbnail
 
     @property
     def height(self) -> int | None:
@@ -120,3 +208,44 @@ class DvrFile:
     @property
     def lock_count(self) -> int:
         return self._lock_count
+
+
+class DvrFileBatch:
+    """Make context for several DVR files at once.
+
+    Thumbnails are extracted by one ffmpeg process per batch of files instead of
+    one process per file. ffprobe accepts a single input, so probing stays per file.
+    """
+
+    _log = ClassLogger()
+
+    def __init__(self, files: list[DvrFile]) -> None:
+        self._files = files
+
+    async def make_context(self) -> None:
+        if len(self._files) == 1:
+            await self._files[0].make_context()
+            return
+
+        batches = [
+            self._files[idx : idx + _THUMBNAIL_BATCH_SIZE]
+            for idx in range(0, len(self._files), _THUMBNAIL_BATCH_SIZE)
+        ]
+        await asyncio.gather(
+            *[file_.make_probe_context() for file_ in self._files],
+            *[self._make_thumbnails(batch) for batch in batches],
+        )
+        for file_ in self._files:
+            file_.invalidate()
+
+    async def _make_thumbnails(self, files: list[DvrFile]) -> None:
+        async with _FF_BINARY_SEMAPHORE:
+            is_created = await MakeThumbnailsTask(
+                thumbnail_paths=[file_.thumbnail_path for file_ in files],
+                file_paths=[file_.full_path for file_ in files],
+            ).run()
+        if not is_created:
+            self._log.warning(
+                'Failed to make batch thumbnails, falling back to one per file'
+            )
+            await asyncio.gather(*[file_.make_thumbnail() for file_ in files])
@@ -25,7 +25,11 @@ class DvrFileDeleteTask:
             locked_files = []
             while not self._queue.empty():
                 file_ = await self._queue.get()
-                if file_.is_locked and not file_.is_broken:
+                if file_.is_upload_failed:
+                    self._log.warning(
+                        'File %s was not uploaded, keeping it on disk', file_
+                    )
+                elif file_.is_locked and not file_.is_broken:
                     self._log.debug(
                         'File %s cannot be deleted right now: %d locks left',
                         file_,
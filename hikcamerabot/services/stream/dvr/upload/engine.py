@@ -6,7 +6,7 @@ from hikcamerabot.config.schemas.main_config import (
     DvrLivestreamConfSchema,
 )
 from hikcamerabot.enums import DvrUploadType
-from hikcamerabot.services.stream.dvr.file_wrapper import DvrFile
+from hikcamerabot.services.stream.dvr.file_wrapper import DvrFile, DvrFileBatch
 from hikcamerabot.services.stream.dvr.tasks.file_delete import DvrFileDeleteTask
 from hikcamerabot.services.stream.dvr.tasks.file_monitoring import DvrFileMonitoringTask
 from hikcamerabot.services.stream.dvr.upload.tasks.abstract import AbstractDvrUploadTask
@@ -58,7 +58,7 @@ class DvrUploadEngine:
     async def _wrap_as_dvr_files(self, files: list[str]) -> list[DvrFile]:
         lock_count = len(self._storage_queues)
         files = [DvrFile(f, lock_count, self._cam) for f in files]
-        await asyncio.gather(*[f.make_context() for f in files])
+        await DvrFileBatch(files).make_context()
         return files
 
     async def start(self) -> None:
@@ -1,45 +1,121 @@
+import asyncio
+import random
 from typing import TYPE_CHECKING, Final
 
 from pyrogram.enums import ChatAction
-from tenacity import retry, stop_after_attempt, wait_fixed
+from pyrogram.errors import (
+    FilePartEmpty,
+    FilePartInvalid,
+    FilePartLengthInvalid,
+    FilePartsInvalid,
+    FilePartSizeInvalid,
+    FilePartTooBig,
+    FloodWait,
+    ImageProcessFailed,
+    InternalServerError,
+    MediaEmpty,
+    MediaFileInvalid,
+    MediaInvalid,
+    ServiceUnavailable,
+    VideoContentTypeInvalid,
+    VideoFileInvalid,
+)
 
 from hikcamerabot.enums import DvrUploadType
 from hikcamerabot.services.stream.dvr.upload.tasks.abstract import (
     AbstractDvrUploadTask,
 )
+from hikcamerabot.utils.file import awaitable_open
 
 if TYPE_CHECKING:
     from hikcamerabot.services.stream.dvr.file_wrapper import DvrFile
 
 _UPLOAD_RETRY_WAIT: Final[int] = 5
+_UPLOAD_RETRY_WAIT_MAX: Final[int] = 60
 _UPLOAD_RETRY_STOP_AFTER: Final[int] = 5
+_UPLOAD_RETRYABLE_ERRORS: Final[tuple[type[Exception], ...]] = (
+    ConnectionError,
+    TimeoutError,
+    FloodWait,
+    InternalServerError,
+    ServiceUnavailable,
+)
+# Telegram rejects the file itself, uploading it again won't help. The file is
+# kept on disk as failed to upload, not marked broken, since broken files get
+# deleted.
+_UPLOAD_FILE_ERRORS: Final[tuple[type[Exception], ...]] = (
+    FilePartEmpty,
+    FilePartInvalid,
+    FilePartLengthInvalid,
+    FilePartsInvalid,
+    FilePartSizeInvalid,
+    FilePartTooBig,
+    ImageProcessFailed,
+    MediaEmpty,
+    MediaFileInvalid,
+    MediaInvalid,
+    VideoContentTypeInvalid,
+    VideoFileInvalid,
+)
+
+
+def _get_upload_retry_wait(err: Exception, attempt: int) -> float:
+    """Wait as long as Telegram asks on flood wait, otherwise back off."""
+    if isinstance(err, FloodWait):
+        return float(err.value)
+    jitter = random.uniform(0, 1)  # noqa: S311
+    return min(_UPLOAD_RETRY_WAIT * 2 ** (attempt - 1) + jitter, _UPLOAD_RETRY_WAIT_MAX)
 
 
 class TelegramDvrUploadTask(AbstractDvrUploadTask):
     UPLOAD_TYPE = DvrUploadType.TELEGRAM
 
     async def run(self) -> None:
-        self._log.debug('Running %s task', self.__class__.__name__)
-        await self._process_queue()
+        self._log.debug(
+            'Running %s task with %d upload workers',
+            self.__class__.__name__,
+            self._conf.parallel_uploads,
+        )
+        await asyncio.gather(
+            *[self._process_queue() for _ in range(self._conf.parallel_uploads)]
+        )
 
     async def _process_queue(self) -> None:
         while True:
             file_ = await self._queue.get()
-            await self._upload_video(file_)
-            file_.decrement_lock_count()
+            try:
+                await self._upload_video(file_)
+            except Exception:
+                self._log.exception('Giving up uploading video %s', file_.full_path)
+                file_.mark_as_upload_failed()
+            finally:
+                file_.decrement_lock_count()
 
-    @retry(
-        wait=wait_fixed(_UPLOAD_RETRY_WAIT),
-        stop=stop_after_attempt(_UPLOAD_RETRY_STOP_AFTER),
-    )
     async def _upload_video(self, file_: 'DvrFile') -> None:
-        try:
-            await self.__upload(file_)
-        except Exception:
-            self._log.exception('Failed to upload video %s. Retrying', file_.full_path)
-            raise
+        for attempt in range(1, _UPLOAD_RETRY_STOP_AFTER + 1):
+            try:
+                await self.__upload(file_)
+            except _UPLOAD_FILE_ERRORS:
+                self._log.exception('Telegram rejected video %s', file_.full_path)
+                file_.mark_as_upload_failed()
+                return
+            except _UPLOAD_RETRYABLE_ERRORS as err:
+                if attempt == _UPLOAD_RETRY_STOP_AFTER:
+                    raise
+                wait = _get_upload_retry_wait(err, attempt)
+                self._log.exception(
+                    'Failed to upload video %s (attempt %d/%d). Retrying in %.1fs',
+                    file_.full_path,
+                    attempt,
+                    _UPLOAD_RETRY_STOP_AFTER,
+                    wait,
+                )
+                await asyncio.sleep(wait)
+            else:
+                return
 
-    def _validate_file(self, file_: 'DvrFile') -> bool:
+    async def _validate_file(self, file_: 'DvrFile') -> bool:
+        await file_.refresh_stat_async()
         if not file_.exists:
             self._log.error('File %s does not exist, cannot upload', file_.full_path)
             return False
@@ -52,7 +128,7 @@ class TelegramDvrUploadTask(AbstractDvrUploadTask):
         return True
 
     async def __upload(self, file_: 'DvrFile') -> None:
-        if not self._validate_file(file_):
+        if not await self._validate_file(file_):
             return
 
         self._log.debug('Uploading DVR video %s', file_.full_path)
@@ -60,15 +136,21 @@ class TelegramDvrUploadTask(AbstractDvrUploadTask):
         await self._bot.send_chat_action(
             self._conf.group_id, action=ChatAction.UPLOAD_VIDEO
         )
-        await self._bot.send_video(
-            self._conf.group_id,
-            caption=caption,
-            video=file_.full_path.as_posix(),
-            file_name=file_.name,
-            duration=file_.duration or 0,
-            height=file_.height or 0,
-            width=file_.width or 0,
-            thumb=file_.thumbnail,
-            supports_streaming=True,
-        )
+        # Open in executor so a slow storage doesn't block the loop; Pyrogram
+        # uses file-like objects as is.
+        video = await awaitable_open(file_.full_path, 'rb')
+        try:
+            await self._bot.send_video(
+                self._conf.group_id,
+                caption=caption,
+                video=video,
+                file_name=file_.name,
+                duration=file_.duration or 0,
+                height=file_.height or 0,
+                width=file_.width or 0,
+                thumb=file_.thumbnail,
+                supports_streaming=True,
+            )
+        finally:
+            video.close()
         self._log.debug('Finished uploading DVR video %s', file_.full_path)
@@ -1,5 +1,6 @@
 import os
 import shutil
+from io import BytesIO
 from pathlib import Path
 from typing import Final
 
@@ -32,6 +33,18 @@ def file_size(filepath: Path) -> int:
     return filepath.stat().st_size
 
 
+def bytes_io_size(buffer: BytesIO) -> int:
+    """Return in-memory file size in bytes and rewind it to the start.
+
+    Unlike `getbuffer().nbytes` this doesn't export a memoryview, which would
+    force `BytesIO` to copy the bytes object it was created from.
+    """
+    size = buffer.seek(0, os.SEEK_END)
+    buffer.seek(0)
+    return size
+
+
 awaitable_shutil_move = wrap(shutil.move)
 awaitable_shutil_copyfileobj = wrap(shutil.copyfileobj)
 awaitable_os_killpg = wrap(os.killpg)
+awaitable_open = wrap(open)
@@ -0,0 +1,20 @@
+import logging
+from typing import Final
+
+_CACHE_ATTR: Final[str] = '_class_logger'
+
+
+class ClassLogger:
+    """Class-level logger named after the class it's accessed on.
+
+    Resolved once per class on first access, so abstract bases which never log
+    don't get a logger of their own.
+    """
+
+    def __get__(self, instance: object | None, owner: type) -> logging.Logger:
+        try:
+            return owner.__dict__[_CACHE_ATTR]
+        except KeyError:
+            logger = logging.getLogger(owner.__name__)
+            setattr(owner, _CACHE_ATTR, logger)
+            return logger